@@ -0,0 +1,559 @@
+"""
+스트림릿 페이지(main.py, pages/gemini.py) 다중 세션 부하 및 메모리 측정 도구
+
+Streamlit의 앱 테스트 API(streamlit.testing.v1.AppTest)로 N개의 세션을
+한 프로세스 안에서 동시에 유지하며, 합성 PDF 업로드 → 슬라이더 조작 →
+다운로드 과정을 라운드마다 반복합니다. 예열 세션으로 한 번만 드는 비용을 뺀 뒤
+세션을 하나 열 때마다, 라운드가 끝날 때마다, 세션을 닫을 때마다 프로세스
+메모리(RSS), st.cache_data 크기, 세션별 session_state/업로드 파일 크기를 기록하고
+마지막에 세션당 증가량(기울기), 종료 후 남은 메모리, 재실행 지연시간 백분위수를
+요약합니다. --churn을 주면 라운드마다 세션 일부를 닫고 새 PDF를 올리는 세션으로
+교체해 캐시 증가와 세션 종료 시 메모리 반환 여부를 확인할 수 있습니다.
+
+RSS는 두 가지로 기록합니다. 실제 서버처럼 할당자가 쥔 메모리까지 포함한 값은
+파드 용량 산정과 --max-session-mb에, glibc malloc_trim으로 빈 힙을 돌려준 뒤의 값은
+세션 종료 시 반환량, 종료 후 잔여량, 라운드당 증가량 같은 누수 판단에 씁니다.
+
+실행 예시:
+    python loadtest.py --sessions 20 --rounds 5
+    python loadtest.py --app main --sessions 10 --rounds 5 --churn 3 --max-round-growth-mb 20 --max-cache-mb 500
+    python loadtest.py --app main --sessions 50 --max-session-mb 40 --json bench_output.json
+
+RSS는 프로세스 전체 값이므로 페이지별 수치를 정확히 비교하려면 --app으로 하나씩 실행하세요.
+"""
+import argparse
+import ctypes
+import gc
+import io
+import json
+import os
+import random
+import resource
+import statistics
+import sys
+import time
+import warnings
+
+import fitz  # PyMuPDF
+from PIL import Image, ImageDraw
+import streamlit as st
+from streamlit import logger as st_logger
+from streamlit.runtime.caching import get_data_cache_stats_provider
+from streamlit.testing.v1 import AppTest
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATHS = {
+    "main": os.path.join(BASE_DIR, "main.py"),
+    "gemini": os.path.join(BASE_DIR, "pages", "gemini.py"),
+}
+MB = 1024 * 1024
+
+
+# --- 합성 입력 데이터 ---
+def make_synthetic_pdf(page_count, seed):
+    """seed마다 내용이 다른 A4 크기 PDF 생성 (캐시 키가 세션마다 달라지도록)"""
+    rng = random.Random(seed)
+    pdf_document = fitz.open()
+    for page_num in range(page_count):
+        page = pdf_document.new_page(width=595, height=842)
+        page.insert_text((72, 72), f"부하 테스트 문서 #{seed} - 페이지 {page_num + 1}", fontsize=14)
+        for line in range(30):
+            page.insert_text((72, 110 + line * 22), "".join(rng.choice("abcdefghij ") for _ in range(60)), fontsize=10)
+        page.draw_rect(fitz.Rect(400, 700, 540, 780), color=(0, 0, 0))
+    pdf_bytes = pdf_document.tobytes()
+    pdf_document.close()
+    return pdf_bytes
+
+
+def make_synthetic_signature(seed, size=(400, 160)):
+    """흰 배경 위에 검은 획을 그린 서명 PNG 바이트 생성"""
+    rng = random.Random(seed)
+    img = Image.new("RGB", size, (255, 255, 255))
+    draw = ImageDraw.Draw(img)
+    points = [(rng.randint(10, size[0] - 10), rng.randint(10, size[1] - 10)) for _ in range(12)]
+    draw.line(points, fill=(0, 0, 0), width=5)
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+# --- 메모리 측정 ---
+def current_rss_bytes():
+    """현재 프로세스의 RSS와, 최대 RSS로 대체했는지 여부 (리눅스가 아니면 최대 RSS 사용)"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE"), False
+    except (OSError, ValueError, IndexError):
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS는 바이트, 리눅스는 KB 단위
+        return (max_rss if sys.platform == "darwin" else max_rss * 1024), True
+
+
+def collect_garbage():
+    """회수할 것이 없을 때까지 GC 실행"""
+    # 스크립트 실행마다 생기는 모듈 네임스페이스는 캐시 함수와 순환 참조를 이뤄 GC 한 번으로는 다 풀리지 않음
+    for _ in range(10):
+        if not gc.collect():
+            break
+
+
+def trim_heap():
+    """glibc라면 비워진 힙을 OS에 돌려줌 (실제 서버는 하지 않으므로 누수 판단용 수치에만 사용)"""
+    try:
+        ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):
+        return False
+    return True
+
+
+def estimate_size(obj, seen=None):
+    """세션 상태 값이 실제로 붙잡고 있는 메모리 추정 (이미지 픽셀 버퍼 포함)"""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, Image.Image):
+        return obj.width * obj.height * len(obj.getbands())
+    if isinstance(obj, (bytes, bytearray)):
+        return len(obj)
+    if isinstance(obj, io.BytesIO):
+        return obj.getbuffer().nbytes
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            estimate_size(key, seen) + estimate_size(value, seen) for key, value in obj.items()
+        )
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return sys.getsizeof(obj) + sum(estimate_size(item, seen) for item in obj)
+    return sys.getsizeof(obj)
+
+
+def session_state_bytes(app_test):
+    """AppTest 세션 하나의 st.session_state 크기 (키가 없는 위젯 값은 제외)"""
+    state = app_test.session_state
+    return sum(estimate_size(state[key]) for key in list(state))
+
+
+def uploaded_file_bytes(app_test):
+    """세션이 붙잡고 있는 업로드 파일 크기 (위젯 id로 저장되어 session_state 순회에 안 잡힘)"""
+    state = app_test.session_state
+    total = 0
+    for uploader in app_test.file_uploader:
+        try:
+            value = state[uploader.id]
+        except KeyError:
+            continue
+        files = value if isinstance(value, list) else [value]
+        total += sum(uploaded.size for uploaded in files if uploaded is not None)
+    return total
+
+
+def slope(xs, ys):
+    """최소제곱 직선의 기울기 (점이 2개 미만이거나 x가 모두 같으면 None)"""
+    if len(xs) < 2:
+        return None
+    mean_x = statistics.mean(xs)
+    mean_y = statistics.mean(ys)
+    denominator = sum((x - mean_x) ** 2 for x in xs)
+    if denominator == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / denominator
+
+
+def cache_data_bytes():
+    """st.cache_data 전체 크기와 함수별 크기"""
+    per_function = {}
+    for stats in get_data_cache_stats_provider().get_stats().values():
+        for stat in stats:
+            per_function[stat.cache_name] = per_function.get(stat.cache_name, 0) + stat.byte_length
+    return sum(per_function.values()), per_function
+
+
+def percentile(values, pct):
+    """정렬된 값에서 선형 보간으로 백분위수 계산"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+# --- 시뮬레이션 세션 ---
+class SimulatedSession:
+    """AppTest 하나로 사용자 한 명의 세션을 흉내 냄"""
+
+    def __init__(self, app_name, session_id, pdf_bytes, signature_bytes, timeout, seed):
+        self.app_name = app_name
+        self.session_id = session_id
+        self.pdf_bytes = pdf_bytes
+        self.signature_bytes = signature_bytes
+        self.rng = random.Random(seed)
+        self.latencies = []
+        self.pending_latencies = []
+        self.errors = []
+        self.downloads = 0
+        self.app_test = AppTest.from_file(APP_PATHS[app_name], default_timeout=timeout)
+
+    def _run(self, action, widget=None):
+        """재실행 한 번을 수행하고 지연시간과 예외를 기록"""
+        target = widget if widget is not None else self.app_test
+        started = time.perf_counter()
+        try:
+            target.run()
+        except Exception as e:
+            self.errors.append(f"{action}: {e}")
+            return
+        latency = (time.perf_counter() - started) * 1000
+        self.latencies.append(latency)
+        self.pending_latencies.append(latency)
+        for exception in self.app_test.exception:
+            self.errors.append(f"{action}: {exception.message}")
+
+    def upload(self):
+        """첫 화면 로드 후 PDF와 서명 이미지 업로드"""
+        try:
+            self._run("initial")
+            pdf_uploader, signature_uploader = self.app_test.sidebar.file_uploader[:2]
+            pdf_uploader.upload(f"session_{self.session_id}.pdf", self.pdf_bytes, "application/pdf")
+            signature_uploader.upload("signature.png", self.signature_bytes, "image/png")
+            self._run("upload")
+        except Exception as e:
+            # 위젯이 렌더링되지 않는 회귀도 보고서에 남기고 측정은 계속 진행
+            self.errors.append(f"upload 중단: {e!r}")
+
+    def interact(self):
+        """라운드 한 번 분량의 사용자 조작"""
+        try:
+            if self.app_name == "main":
+                self._interact_main()
+            else:
+                self._interact_gemini()
+        except Exception as e:
+            self.errors.append(f"interact 중단: {e!r}")
+
+    def drain_latencies(self):
+        """마지막 호출 이후 쌓인 재실행 지연시간을 꺼냄 (구간별 백분위수용)"""
+        latencies, self.pending_latencies = self.pending_latencies, []
+        return latencies
+
+    def close(self):
+        """세션 종료 (브라우저 탭을 닫은 것처럼 AppTest를 놓아줌)"""
+        self.app_test = None
+
+    def _interact_main(self):
+        at = self.app_test
+        self._run("sig_width", at.slider(key="sig_width").set_value(self.rng.randint(50, 300)))
+
+        page_selector = at.selectbox(key="page_selector")
+        page = self.rng.choice(page_selector.options)
+        page = int(page.split()[-1]) - 1
+        self._run("page_selector", page_selector.set_value(page))
+
+        x_slider = at.slider(key=f"x_slider_{page}")
+        y_slider = at.slider(key=f"y_slider_{page}")
+        x_slider.set_value(self.rng.randrange(x_slider.min, x_slider.max + 1, 5))
+        y_slider.set_value(self.rng.randrange(y_slider.min, y_slider.max + 1, 5))
+        self._run("position", at)
+
+        self._run("add_signature", at.button(key=f"add_signature_{page}").click())
+        self._run("download_pdf", at.button(key="download_pdf").click())
+        self.downloads += len(at.get("download_button"))
+        self._run("download_image", at.button(key="download_image").click())
+        self.downloads += len(at.get("download_button"))
+
+    def _interact_gemini(self):
+        at = self.app_test
+        page_input = at.sidebar.number_input[0]
+        page_input.set_value(self.rng.randint(int(page_input.min), int(page_input.max)))
+        self._run("page", page_input)
+        self._run("sig_width", at.sidebar.slider[0].set_value(self.rng.randint(20, 300)))
+        # 캔버스 클릭은 브라우저 없이 흉내 낼 수 없으므로 적용 버튼은 경고로 끝남
+        self._run("apply_signature", at.button(key="apply_signature").click())
+        self.downloads += len(at.get("download_button"))
+
+
+# --- 실행 및 보고 ---
+def take_sample(label, sessions, latencies=()):
+    """GC 후 메모리, 캐시, 세션별 보유 데이터 크기와 이 구간의 재실행 지연시간을 한 번 기록"""
+    collect_garbage()
+    rss_bytes, rss_is_peak = current_rss_bytes()
+    # 힙 반환 전 RSS는 실제 파드가 쥐는 양(용량 산정용), 반환 후 RSS는 살아 있는 메모리(누수 판단용)
+    trimmed_rss_bytes = current_rss_bytes()[0] if trim_heap() else rss_bytes
+    cache_total, cache_per_function = cache_data_bytes()
+    return {
+        "label": label,
+        "live_sessions": len(sessions),
+        "rss_bytes": rss_bytes,
+        "trimmed_rss_bytes": trimmed_rss_bytes,
+        "rss_is_peak": rss_is_peak,
+        "latency_count": len(latencies),
+        "latency_p50_ms": percentile(latencies, 50) if latencies else None,
+        "latency_p95_ms": percentile(latencies, 95) if latencies else None,
+        "cache_bytes": cache_total,
+        "cache_per_function": cache_per_function,
+        "session_state_bytes": [session_state_bytes(session.app_test) for session in sessions],
+        "upload_bytes": [uploaded_file_bytes(session.app_test) for session in sessions],
+    }
+
+
+def open_session(app_name, session_id, args, shared_pdf=None):
+    """새 세션을 만들고 파일 업로드까지 수행"""
+    seed = args.seed + session_id
+    pdf_bytes = shared_pdf or make_synthetic_pdf(args.pages, seed)
+    session = SimulatedSession(
+        app_name, session_id, pdf_bytes, make_synthetic_signature(seed), args.timeout, seed
+    )
+    session.upload()
+    return session
+
+
+def warm_up(app_name, args):
+    """임포트, 첫 렌더링 등 한 번만 드는 비용을 기준선에서 빼기 위한 예열 세션"""
+    session = open_session(app_name, -1, args)
+    session.interact()
+    session.close()
+    st.cache_data.clear()
+
+
+def run_app(app_name, args):
+    """한 페이지에 대해 세션을 하나씩 늘리고, 라운드를 반복하며 세션을 교체하고, 모두 닫으며 샘플 수집"""
+    st.cache_data.clear()
+    warm_up(app_name, args)
+    shared_pdf = make_synthetic_pdf(args.pages, args.seed) if args.shared_pdf else None
+
+    sessions = []
+    closed = []
+    samples = [take_sample("baseline", sessions)]
+    next_session_id = 0
+    for _ in range(args.sessions):
+        session = open_session(app_name, next_session_id, args, shared_pdf)
+        sessions.append(session)
+        next_session_id += 1
+        samples.append(take_sample(f"session {len(sessions)}", sessions, session.drain_latencies()))
+    ramp_samples = list(samples)
+
+    round_samples = []
+    released_per_session = []
+    for round_num in range(1, args.rounds + 1):
+        for session in sessions:
+            session.interact()
+        round_latencies = [latency for session in sessions for latency in session.drain_latencies()]
+        round_sample = take_sample(f"round {round_num}", sessions, round_latencies)
+        samples.append(round_sample)
+        round_samples.append(round_sample)
+
+        if args.churn:
+            # 오래된 세션을 닫고 새 PDF를 올리는 세션으로 교체 (캐시 증가와 해제 여부 확인)
+            for session in sessions[:args.churn]:
+                session.close()
+                closed.append(session)
+            del sessions[:args.churn]
+            drop_sample = take_sample(f"round {round_num} -{args.churn}", sessions)
+            samples.append(drop_sample)
+            released_per_session.append(
+                (round_sample["trimmed_rss_bytes"] - drop_sample["trimmed_rss_bytes"]) / args.churn
+            )
+
+            opened = []
+            for _ in range(args.churn):
+                session = open_session(app_name, next_session_id, args, shared_pdf)
+                # 첫 조작에서 위젯 상태가 채워지는 비용이 다음 라운드 증가량에 섞이지 않도록 미리 한 번 조작
+                session.interact()
+                opened.append(session)
+                next_session_id += 1
+            sessions.extend(opened)
+            opened_latencies = [latency for session in opened for latency in session.drain_latencies()]
+            samples.append(take_sample(f"round {round_num} +{args.churn}", sessions, opened_latencies))
+
+    for session in sessions:
+        session.close()
+        closed.append(session)
+    final = take_sample("closed", [])
+    samples.append(final)
+
+    baseline = ramp_samples[0]
+    live_counts = [sample["live_sessions"] for sample in ramp_samples]
+    rss_per_session = slope(live_counts, [sample["rss_bytes"] for sample in ramp_samples])
+    trimmed_rss_per_session = slope(live_counts, [sample["trimmed_rss_bytes"] for sample in ramp_samples])
+    cache_per_session = slope(live_counts, [sample["cache_bytes"] for sample in ramp_samples])
+    # 첫 라운드는 위젯 상태가 처음 채워지는 구간이라 라운드 샘플끼리의 기울기만 보고,
+    # --churn으로 새 PDF가 올라가며 늘어난 캐시는 --max-cache-mb가 따로 보므로 빼고 계산
+    round_growth = slope(
+        list(range(len(round_samples))),
+        [sample["trimmed_rss_bytes"] - sample["cache_bytes"] for sample in round_samples],
+    )
+    # 최대 RSS로 대체된 경우 줄어드는 일이 없으므로 반환량/잔여량은 의미가 없음
+    rss_is_peak = any(sample["rss_is_peak"] for sample in samples)
+
+    latencies = [latency for session in closed for latency in session.latencies]
+    peak = ramp_samples[-1]
+    return {
+        "app": app_name,
+        "sessions": args.sessions,
+        "rounds": args.rounds,
+        "churn": args.churn,
+        "baseline_rss_bytes": baseline["rss_bytes"],
+        "rss_per_session_bytes": rss_per_session,
+        "trimmed_rss_per_session_bytes": trimmed_rss_per_session,
+        "rss_is_peak": rss_is_peak,
+        "cache_per_session_bytes": cache_per_session,
+        "mean_session_state_bytes": statistics.mean(peak["session_state_bytes"]) if args.sessions else 0,
+        "mean_upload_bytes": statistics.mean(peak["upload_bytes"]) if args.sessions else 0,
+        "rss_growth_per_round_bytes": round_growth,
+        "released_per_closed_session_bytes": (
+            statistics.mean(released_per_session) if released_per_session and not rss_is_peak else None
+        ),
+        "retained_rss_bytes": None if rss_is_peak else final["trimmed_rss_bytes"] - baseline["trimmed_rss_bytes"],
+        "retained_cache_bytes": final["cache_bytes"],
+        "latency_ms": {
+            "count": len(latencies),
+            "p50": percentile(latencies, 50),
+            "p90": percentile(latencies, 90),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+            "max": max(latencies, default=0.0),
+        },
+        "downloads": sum(session.downloads for session in closed),
+        "errors": [f"세션 {session.session_id} {error}" for session in closed for error in session.errors],
+        "samples": samples,
+    }
+
+
+def format_mb(value):
+    """바이트 값을 MB 문자열로 (측정할 수 없으면 '측정 불가')"""
+    return "측정 불가" if value is None else f"{value / MB:.2f} MB"
+
+
+def print_report(result):
+    """결과를 사람이 읽기 좋은 형태로 출력"""
+    print(f"\n=== {result['app']} : 세션 {result['sessions']}개 × {result['rounds']}라운드, 라운드당 교체 {result['churn']}개 ===")
+    if result["rss_is_peak"]:
+        print("⚠️ 현재 RSS를 읽을 수 없어 최대 RSS로 대신 측정했습니다 (줄어드는 값은 보이지 않음)")
+    print(
+        f"{'시점':<14} {'세션':>5} {'RSS(MB)':>10} {'반환 후(MB)':>11} {'캐시(MB)':>10} "
+        f"{'session_state 평균(MB)':>22} {'업로드 파일 평균(MB)':>20} {'p50(ms)':>8} {'p95(ms)':>8}"
+    )
+    for sample in result["samples"]:
+        state_sizes = sample["session_state_bytes"] or [0]
+        upload_sizes = sample["upload_bytes"] or [0]
+        p50 = "-" if sample["latency_p50_ms"] is None else f"{sample['latency_p50_ms']:.0f}"
+        p95 = "-" if sample["latency_p95_ms"] is None else f"{sample['latency_p95_ms']:.0f}"
+        print(
+            f"{sample['label']:<14} {sample['live_sessions']:>5} {sample['rss_bytes'] / MB:>10.1f} "
+            f"{sample['trimmed_rss_bytes'] / MB:>11.1f} {sample['cache_bytes'] / MB:>10.1f} "
+            f"{statistics.mean(state_sizes) / MB:>22.2f} {statistics.mean(upload_sizes) / MB:>20.2f} "
+            f"{p50:>8} {p95:>8}"
+        )
+
+    latency = result["latency_ms"]
+    print(
+        f"전체 재실행 지연시간(ms, {latency['count']}회): p50 {latency['p50']:.0f} / p90 {latency['p90']:.0f} / "
+        f"p95 {latency['p95']:.0f} / p99 {latency['p99']:.0f} / 최대 {latency['max']:.0f}"
+    )
+    print(f"세션 하나 추가당 RSS 증가량 (예열 후 기울기): {format_mb(result['rss_per_session_bytes'])}")
+    print(f"  └ 힙 반환 후 기준: {format_mb(result['trimmed_rss_per_session_bytes'])}")
+    print(f"세션 하나 추가당 캐시 증가량: {format_mb(result['cache_per_session_bytes'])}")
+    print(
+        f"세션당 보유 데이터: session_state {format_mb(result['mean_session_state_bytes'])} "
+        f"+ 업로드 파일 {format_mb(result['mean_upload_bytes'])}"
+    )
+    print(f"라운드당 RSS 증가량 (라운드 간 기울기, 캐시 증가분 제외): {format_mb(result['rss_growth_per_round_bytes'])}")
+    if result["churn"]:
+        print(f"세션 하나 종료 시 반환된 RSS: {format_mb(result['released_per_closed_session_bytes'])}")
+    print(
+        f"모든 세션 종료 후 남은 메모리: RSS {format_mb(result['retained_rss_bytes'])} (기준선 대비), "
+        f"캐시 {format_mb(result['retained_cache_bytes'])}"
+    )
+    for name, size in result["samples"][-1]["cache_per_function"].items():
+        print(f"캐시 {name}: {size / MB:.2f} MB")
+    print(f"다운로드 버튼 생성 횟수: {result['downloads']}")
+    if result["errors"]:
+        print(f"⚠️ 오류 {len(result['errors'])}건 (처음 5건):")
+        for error in result["errors"][:5]:
+            print(f"  - {error}")
+
+
+def check_limits(result, args):
+    """임계값을 넘은 항목 목록 반환 (배포 전 회귀 확인용)"""
+    failures = []
+    if result["errors"]:
+        failures.append(f"{result['app']}: 스크립트 오류 {len(result['errors'])}건")
+    rss_per_session = result["rss_per_session_bytes"]
+    if args.max_session_mb is not None and rss_per_session is not None and rss_per_session > args.max_session_mb * MB:
+        failures.append(f"{result['app']}: 세션당 RSS {rss_per_session / MB:.1f} MB > {args.max_session_mb} MB")
+    peak_cache = max(sample["cache_bytes"] for sample in result["samples"])
+    if args.max_cache_mb is not None and peak_cache > args.max_cache_mb * MB:
+        failures.append(f"{result['app']}: 캐시 {peak_cache / MB:.1f} MB > {args.max_cache_mb} MB")
+    round_growth = result["rss_growth_per_round_bytes"]
+    if args.max_round_growth_mb is not None and round_growth is not None and round_growth > args.max_round_growth_mb * MB:
+        failures.append(
+            f"{result['app']}: 라운드당 RSS 증가(캐시 제외) {round_growth / MB:.1f} MB > {args.max_round_growth_mb} MB"
+        )
+    if args.max_p95_ms is not None and result["latency_ms"]["p95"] > args.max_p95_ms:
+        failures.append(f"{result['app']}: p95 {result['latency_ms']['p95']:.0f} ms > {args.max_p95_ms} ms")
+    return failures
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="스트림릿 페이지 다중 세션 부하/메모리 측정")
+    parser.add_argument("--app", choices=["main", "gemini", "all"], default="all", help="측정할 페이지")
+    parser.add_argument("--sessions", type=int, default=10, help="동시에 유지할 세션 수")
+    parser.add_argument("--rounds", type=int, default=3, help="세션마다 반복할 조작 라운드 수")
+    parser.add_argument("--churn", type=int, default=0, help="라운드마다 닫고 새로 여는 세션 수 (새 PDF 업로드)")
+    parser.add_argument("--pages", type=int, default=3, help="합성 PDF 페이지 수")
+    parser.add_argument("--shared-pdf", action="store_true", help="모든 세션이 같은 PDF를 업로드 (캐시 적중 시나리오)")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--timeout", type=float, default=60, help="재실행 한 번의 제한 시간(초)")
+    parser.add_argument("--json", dest="json_path", help="전체 결과를 JSON으로 저장할 경로")
+    parser.add_argument("--max-session-mb", type=float, help="세션 하나 추가당 RSS 증가량 상한 (힙 반환 전 기준)")
+    parser.add_argument("--max-cache-mb", type=float, help="st.cache_data 최대 크기 상한")
+    parser.add_argument("--max-round-growth-mb", type=float, help="라운드당 RSS 증가량 상한, 캐시 증가분 제외 (세션 누수 감지, --rounds 2 이상)")
+    parser.add_argument("--max-p95-ms", type=float, help="재실행 지연시간 p95 상한")
+    args = parser.parse_args(argv)
+
+    if args.sessions < 1:
+        parser.error("--sessions는 1 이상이어야 합니다")
+    if not 0 <= args.churn <= args.sessions:
+        parser.error("--churn은 0 이상 --sessions 이하여야 합니다")
+    if args.max_round_growth_mb is not None and args.rounds < 2:
+        parser.error("--max-round-growth-mb는 첫 라운드를 제외하고 비교하므로 --rounds 2 이상이 필요합니다")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    # 스트림릿 로그와 사용 중단 경고가 결과 출력을 덮지 않도록 설정
+    # (set_option이 설정 파일을 먼저 읽으며 로그 수준을 기본값으로 되돌리므로 그 뒤에 다시 적용)
+    warnings.simplefilter("ignore", DeprecationWarning)
+    st.config.set_option("logger.level", "error")
+    st_logger.set_log_level("error")
+
+    app_names = ["main", "gemini"] if args.app == "all" else [args.app]
+    results = []
+    failures = []
+    for app_name in app_names:
+        result = run_app(app_name, args)
+        print_report(result)
+        results.append(result)
+        failures.extend(check_limits(result, args))
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.json_path}")
+
+    if failures:
+        print("\n❌ 임계값 초과:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())